@@ -17,6 +17,18 @@ import fitz  # PyMuPDF
 import json
 import os
 import re
+from functools import lru_cache
+from multiprocessing import Pool
+
+try:
+    import orjson  # optional: much faster JSON encoder
+except ImportError:
+    orjson = None
+
+try:
+    from numba import njit  # optional: compiles the running-header letter count
+except ImportError:
+    njit = None
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 PDF_PATH = os.path.join(SCRIPT_DIR, "dictionary-of-symbols-reprint-edition.pdf")
@@ -29,10 +41,22 @@ OUTPUT_PATH = os.path.join(SCRIPT_DIR, "symbols_dictionary.json")
 DICT_START_PAGE = 8    # 0-indexed (= page 9 in PDF)
 DICT_END_PAGE = 1804   # exclusive; bibliography starts on page 1804
 
+# Pages handed to each worker process by extract_entries_parallel()
+PAGES_PER_CHUNK = 100
+
+# Running headers and page numbers sit in the top/bottom page margins.
+# Blocks lying entirely within these bands (in points) are skipped before
+# any text checks. 0 turns a band off, which is the default: a short entry
+# at the very top or bottom of a page would be dropped too, and the bands
+# have not been checked against the PDF. is_running_header() and
+# is_page_number() catch headers and page numbers either way.
+HEADER_BAND = 0
+FOOTER_BAND = 0
+
 # Common sentence starters that should NOT be treated as proper noun headings.
 # These appear at the start of continuation blocks and would be falsely
 # detected by Pattern 2 (capitalized word + capitalized word).
-SENTENCE_STARTERS = {
+SENTENCE_STARTERS = frozenset({
     "the", "a", "an", "in", "on", "at", "by", "for", "to", "of",
     "it", "its", "this", "that", "these", "those", "they", "them",
     "he", "she", "his", "her", "we", "our", "but", "and", "or",
@@ -47,52 +71,134 @@ SENTENCE_STARTERS = {
     "according", "although", "because", "whether", "like",
     "many", "most", "much", "more", "less", "few", "other",
     "another", "only", "just", "even", "still", "also", "too",
-}
+})
+
+# Function words that never END a real headword (prepositions, articles,
+# conjunctions, pronouns): "death and resurrection of", "blue for".
+FRAG_ENDERS = frozenset({
+    "the", "a", "an", "of", "in", "on", "at", "to", "for", "by",
+    "with", "from", "and", "or", "but", "as", "is", "was", "are",
+    "were", "be", "been", "being", "has", "had", "have", "its",
+    "his", "her", "he", "she", "it", "they", "we", "our", "their",
+    "that", "this", "those", "these", "which", "who", "whom",
+    "not", "no", "nor", "so", "than", "if", "st",
+})
+
+# Function words that, appearing twice inside a 3+ word term, mark it as a
+# sentence fragment rather than a headword like "aqua vitae".
+FRAG_INTERNALS = frozenset({
+    "the", "a", "an", "is", "was", "are", "were", "be",
+    "that", "which", "who", "whom", "has", "had", "have",
+    "not", "also", "been", "being", "its", "his", "her",
+    "their", "our", "my", "your", "can", "could", "would",
+    "should", "will", "shall", "may", "might", "must",
+    "do", "does", "did", "very", "just", "even", "still",
+})
+
+# Internal words that on their own mark a 3+ word term as a fragment.
+STRONG_FRAG_INTERNALS = frozenset({"the", "is", "was", "are", "were"})
+
+# Trailing words trimmed off a capitalized (Pattern 2) term because they
+# belong to the definition, not the name: "Abraham The Old" -> "Abraham".
+TRIM_LOWER = frozenset({
+    "the", "a", "an", "in", "on", "at", "as", "or", "and",
+    "its", "this", "that", "these", "those", "all", "old",
+    "one", "two", "for", "but", "not", "from", "with", "new",
+    "first", "second", "third", "last", "next", "other",
+    "great", "good", "long", "high", "deep", "early", "late",
+    "most", "many", "some", "each", "every", "such",
+})
+
+# Additional single-word exclusions: common English words that are
+# definitely not symbol headwords (caught at post-processing stage)
+SINGLE_WORD_EXCLUSIONS = frozenset({
+    "very", "also", "just", "even", "still", "yet", "only",
+    "often", "always", "never", "rather", "quite",
+    "traditional", "finally", "similarly", "conversely",
+    "originally", "essentially", "generally", "consequently",
+    "alternatively", "accordingly", "subsequently", "nevertheless",
+    "furthermore", "moreover", "whereas", "whereby", "thereby",
+    "nonetheless", "otherwise", "indeed", "certainly",
+    "perhaps", "probably", "possibly", "apparently", "recently",
+    "clearly", "obviously", "simply", "merely", "purely",
+    "primarily", "mainly", "largely", "partly", "partly",
+    "already", "sometimes", "everywhere", "anywhere", "nowhere",
+})
+
+# Heading patterns used by detect_entry_heading(), compiled once at import
+# time since they run against the first line of every text block.
+
+# Pattern 1: lowercase term + space + uppercase start of definition
+_PAT1 = re.compile(
+    r'^([a-z][a-z\s,\'\-]+?)'       # lowercase term (lazy)
+    r'(?:\s*\([^)]*\))?'            # optional CLOSED parenthetical
+    r'\s+'                           # separator
+    r'([A-Z\'\"].*)'                 # definition starts uppercase
+)
+# Pattern 1b: lowercase term + parenthetical that doesn't close on first line
+_PAT1B = re.compile(r'^([a-z][a-z\s,\'\-]+?)\s+\(')
+# Pattern 3: cross-reference, e.g. "aureole See halo."
+_PAT3 = re.compile(r'^([a-z][a-z\s,\'\-]+?)\s+[Ss]ee\s+')
+# Pattern 4: lowercase term + parenthetical cross-ref only
+_PAT4 = re.compile(r'^([a-z][a-z\s,\'\-]+?)\s+\([Ss]ee\s+(?:also\s+)?[^)]+\)')
+
+_SEE_PREFIX = re.compile(r'\([Ss]ee\s')
+_SEE_START = re.compile(r'^[Ss]ee\s+')
+_PAREN_SEE_START = re.compile(r'^\([Ss]ee\s+')
+_WS = re.compile(r'\s+')
+_SOFT_HYPHEN_TABLE = str.maketrans("", "", "\xad")
+
+
+def _count_letters(text):
+    """Return (upper_count, alpha_count) for the letters in text."""
+    alpha_count = 0
+    upper_count = 0
+    for c in text:
+        if c.isalpha():
+            alpha_count += 1
+            if c.isupper():
+                upper_count += 1
+    return upper_count, alpha_count
+
+
+if njit is not None:
+    @njit(cache=True, nogil=True)
+    def _count_ascii_letters(bs):
+        """_count_letters() for ASCII text passed as bytes, compiled by numba."""
+        alpha_count = 0
+        upper_count = 0
+        for i in range(len(bs)):
+            b = bs[i]
+            if 65 <= b <= 90:      # A-Z
+                alpha_count += 1
+                upper_count += 1
+            elif 97 <= b <= 122:   # a-z
+                alpha_count += 1
+        return upper_count, alpha_count
+else:
+    _count_ascii_letters = None
 
 
 def is_running_header(text):
     """Detect ALL-CAPS running headers like 'AUTOMOBILE', 'DREAM', 'SWASTIKA'."""
     stripped = text.strip().rstrip('.')
-    if not stripped:
-        return False
-    alpha_chars = [c for c in stripped if c.isalpha()]
-    if not alpha_chars:
+    # Length first: nearly every line we see is full-width body text
+    if not 2 <= len(stripped) <= 50:
         return False
-    upper_ratio = sum(1 for c in alpha_chars if c.isupper()) / len(alpha_chars)
-    if upper_ratio >= 0.9 and 2 <= len(stripped) <= 50:
-        return True
-    return False
+    # For ASCII text, A-Z/a-z are exactly the isupper()/isalpha() letters
+    if _count_ascii_letters is not None and stripped.isascii():
+        upper_count, alpha_count = _count_ascii_letters(stripped.encode("ascii"))
+    else:
+        upper_count, alpha_count = _count_letters(stripped)
+    # At least 90% of the letters are capitals
+    return alpha_count > 0 and upper_count * 10 >= alpha_count * 9
 
 
 def is_page_number(text):
     """Detect standalone page numbers like '311', '59'."""
     stripped = text.strip()
-    return bool(re.match(r'^\d{1,4}$', stripped))
-
-
-def get_block_text(block):
-    """Extract all text from a block dict, line by line."""
-    if block["type"] != 0:  # non-text block
-        return ""
-    lines = []
-    for line in block["lines"]:
-        line_text = ""
-        for span in line["spans"]:
-            line_text += span["text"]
-        lines.append(line_text)
-    return "\n".join(lines)
-
-
-def get_block_first_line(block):
-    """Get just the first line of text from a block."""
-    if block["type"] != 0:
-        return ""
-    for line in block["lines"]:
-        text = ""
-        for span in line["spans"]:
-            text += span["text"]
-        return text.strip()
-    return ""
+    # str.isdecimal() accepts exactly the characters regex \d does
+    return 1 <= len(stripped) <= 4 and stripped.isdecimal()
 
 
 def _is_valid_term(term):
@@ -105,12 +211,18 @@ def _is_valid_term(term):
     Fragments:      "death and resurrection of", "pura in the",
                     "very", "blue for", "Cabeiri The"
     """
-    words = term.split()
+    return _is_valid_term_lower(term.lower())
+
+
+@lru_cache(maxsize=8192)
+def _is_valid_term_lower(term_lower):
+    """_is_valid_term() for a term that has already been lowercased."""
+    words = term_lower.split()
     if not words:
         return False
 
-    first_word = words[0].lower()
-    last_word = words[-1].lower()
+    first_word = words[0]
+    last_word = words[-1]
 
     # First word is a common sentence starter
     if first_word in SENTENCE_STARTERS:
@@ -118,14 +230,6 @@ def _is_valid_term(term):
 
     # Last word is a function word (preposition, article, conjunction)
     # Real headwords don't end with these
-    FRAG_ENDERS = {
-        "the", "a", "an", "of", "in", "on", "at", "to", "for", "by",
-        "with", "from", "and", "or", "but", "as", "is", "was", "are",
-        "were", "be", "been", "being", "has", "had", "have", "its",
-        "his", "her", "he", "she", "it", "they", "we", "our", "their",
-        "that", "this", "those", "these", "which", "who", "whom",
-        "not", "no", "nor", "so", "than", "if", "st",
-    }
     if last_word in FRAG_ENDERS:
         return False
 
@@ -137,25 +241,75 @@ def _is_valid_term(term):
     # "death and resurrection of" has "and" + "of"
     # But "aqua vitae" or "lapis lazuli" are fine
     if len(words) >= 3:
-        internal_words = [w.lower() for w in words[1:]]
-        FRAG_INTERNALS = {
-            "the", "a", "an", "is", "was", "are", "were", "be",
-            "that", "which", "who", "whom", "has", "had", "have",
-            "not", "also", "been", "being", "its", "his", "her",
-            "their", "our", "my", "your", "can", "could", "would",
-            "should", "will", "shall", "may", "might", "must",
-            "do", "does", "did", "very", "just", "even", "still",
-        }
+        internal_words = words[1:]
         internal_frag_count = sum(1 for w in internal_words if w in FRAG_INTERNALS)
         if internal_frag_count >= 2:
             return False
         # If internal words contain "the", "is", "was" — very likely a fragment
-        if any(w in {"the", "is", "was", "are", "were"} for w in internal_words):
+        if any(w in STRONG_FRAG_INTERNALS for w in internal_words):
             return False
 
     return True
 
 
+def _is_capitalized_word(word):
+    """True if word is a capital followed by lowercase letters (regex [A-Z][a-z]+)."""
+    return (
+        len(word) >= 2 and word.isascii() and word.isalpha()
+        and word[0].isupper() and word[1:].islower()
+    )
+
+
+def _detect_proper_noun_heading(line):
+    """
+    Pattern 2: Capitalized proper noun term + definition.
+
+    Matches: "Abraham The Old Testament..." or "Aurora Borealis A manifestation..."
+    BUT NOT: "The African legend..." or "Both St John..."
+
+    Strategy: greedily capture capitalized words, then trim trailing
+    articles/starters that belong to the definition, not the term.
+    """
+    # Walk the leading run of capitalized words
+    words = line.split()
+    count = 0
+    while count < len(words) and _is_capitalized_word(words[count]):
+        count += 1
+    # The definition must start right after the term with [A-Z][a-z]. If the
+    # word following the run doesn't, the run's own last word starts it.
+    if count == len(words) or not (
+        len(words[count]) >= 2
+        and 'A' <= words[count][0] <= 'Z'
+        and 'a' <= words[count][1] <= 'z'
+    ):
+        count -= 1
+    if count < 1:
+        return None
+
+    # Trim trailing words that belong to the definition, not the name.
+    # "Abraham The Old" -> just "Abraham"
+    # "Aurora Borealis" -> stays "Aurora Borealis" (both are proper nouns)
+    # "Snow White" -> stays "Snow White"
+    # Strategy: trim trailing words whose lowercase form is a common
+    # English word (articles, adjectives, adverbs, etc.)
+    parts = words[:count]
+    while len(parts) > 1 and parts[-1].lower() in TRIM_LOWER:
+        parts.pop()
+    term = " ".join(parts)
+    # Find where the trimmed term ends in the line (the words may be
+    # separated by more than one space) and recalculate rest from there
+    term_end = 0
+    for word in parts:
+        term_end = line.index(word, term_end) + len(word)
+    rest = line[term_end:].strip()
+    if len(term) <= 35 and len(rest) >= 10:
+        if not is_running_header(term):
+            if _is_valid_term(term):
+                return term, term_end
+
+    return None
+
+
 def detect_entry_heading(first_line):
     """
     Detect if a block's first line starts a new dictionary entry.
@@ -171,231 +325,255 @@ def detect_entry_heading(first_line):
         'fiery curtain The fiery curtain constitutes...'
         'aureole See halo.'
         'tower (see also house; ziggurat) The tower...'
+
+    Returns (term, term_end) -- term_end being the index in the stripped
+    line just past the term, where the definition text starts -- or None.
     """
     line = first_line.strip()
     if len(line) < 5:
         return None
 
+    # Every pattern is anchored on the first character: only Pattern 2 can
+    # match a capitalized line, and the rest need a lowercase term. Most
+    # blocks are continuations starting mid-sentence, so this skips the
+    # regexes that cannot match them.
+    first_char = line[0]
+    if first_char.isupper():
+        return _detect_proper_noun_heading(line)
+    if not first_char.islower():
+        return None
+
     # Pattern 1: lowercase term + space + uppercase start of definition
     # Matches: "abracadabra This charm..." or "aqua vitae The alchemists..."
     # Also handles parenthetical cross-refs: "tower (see also house) The tower..."
     # For long parentheticals like "bird (see also anqa; bustard; cock; ...)"
     # we match just the term before the parenthetical.
-    m = re.match(
-        r'^([a-z][a-z\s,\'\-]+?)'       # lowercase term (lazy)
-        r'(?:\s*\([^)]*\))?'            # optional CLOSED parenthetical
-        r'\s+'                           # separator
-        r'([A-Z\'\"].*)',                # definition starts uppercase
-        line
-    )
+    m = _PAT1.match(line)
     if m:
         term = m.group(1).strip().rstrip('.,')
         rest = m.group(2)
         if 2 <= len(term) <= 50 and len(rest) >= 10:
             if _is_valid_term(term):
-                return term
+                return term, m.end(1)
 
     # Pattern 1b: lowercase term + LONG parenthetical that doesn't close on first line
     # Matches: "bird (see also anqa; bustard; cock; crane; crow; ..."
-    m = re.match(
-        r'^([a-z][a-z\s,\'\-]+?)\s+\(',  # term + open paren
-        line
-    )
+    m = _PAT1B.match(line)
     if m:
         term = m.group(1).strip().rstrip('.,')
         # Check if this looks like "(see also ...)" or "(see ...)"
         paren_content = line[m.end()-1:]  # from the '('
-        if re.match(r'\([Ss]ee\s', paren_content):
+        if _SEE_PREFIX.match(paren_content):
             if 2 <= len(term) <= 50 and _is_valid_term(term):
-                return term
-
-    # Pattern 2: Capitalized proper noun term + definition
-    # Matches: "Abraham The Old Testament..." or "Aurora Borealis A manifestation..."
-    # BUT NOT: "The African legend..." or "Both St John..."
-    #
-    # Strategy: greedily capture capitalized words, then trim trailing
-    # articles/starters that belong to the definition, not the term.
-    m = re.match(
-        r'^([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)'  # Capitalized words (greedy)
-        r'\s+'                                   # separator
-        r'([A-Z][a-z].*)',                        # definition starts
-        line
-    )
-    if m:
-        raw_term = m.group(1).strip()
-        # Trim trailing words that belong to the definition, not the name.
-        # "Abraham The Old" -> just "Abraham"
-        # "Aurora Borealis" -> stays "Aurora Borealis" (both are proper nouns)
-        # "Snow White" -> stays "Snow White"
-        # Strategy: trim trailing words whose lowercase form is a common
-        # English word (articles, adjectives, adverbs, etc.)
-        TRIM_LOWER = {
-            "the", "a", "an", "in", "on", "at", "as", "or", "and",
-            "its", "this", "that", "these", "those", "all", "old",
-            "one", "two", "for", "but", "not", "from", "with", "new",
-            "first", "second", "third", "last", "next", "other",
-            "great", "good", "long", "high", "deep", "early", "late",
-            "most", "many", "some", "each", "every", "such",
-        }
-        parts = raw_term.split()
-        while len(parts) > 1 and parts[-1].lower() in TRIM_LOWER:
-            parts.pop()
-        term = " ".join(parts)
-        # Recalculate rest (everything after the trimmed term)
-        rest = line[len(term):].strip()
-        if len(term) <= 35 and len(rest) >= 10:
-            if not is_running_header(term):
-                if _is_valid_term(term):
-                    return term
+                return term, m.end(1)
 
     # Pattern 3: Cross-reference: "aureole See halo." or "mandorla See under almond."
-    m = re.match(
-        r'^([a-z][a-z\s,\'\-]+?)\s+[Ss]ee\s+',
-        line
-    )
+    m = _PAT3.match(line)
     if m:
         term = m.group(1).strip().rstrip('.,')
         if 2 <= len(term) <= 50:
-            return term
+            return term, m.end(1)
 
     # Pattern 4: lowercase term + parenthetical cross-ref only
     # Matches: "anqa (see also simurg)" with no further text
-    m = re.match(
-        r'^([a-z][a-z\s,\'\-]+?)\s+\([Ss]ee\s+(?:also\s+)?[^)]+\)',
-        line
-    )
+    m = _PAT4.match(line)
     if m:
         term = m.group(1).strip().rstrip('.,')
         if 2 <= len(term) <= 50:
-            return term
+            return term, m.end(1)
 
     return None
 
 
-def extract_entries(doc):
-    """Extract all dictionary entries from the PDF using block-level analysis."""
-    entries = []
-    current_term = None
-    current_definition_lines = []
-    current_page = 0
+def _content_lines(lines):
+    """Yield stripped definition lines, skipping blanks, headers and page numbers."""
+    _is_header = is_running_header
+    _is_page_num = is_page_number
+    for line in lines:
+        line = line.strip()
+        if line and not _is_header(line) and not _is_page_num(line):
+            yield line
+
+
+def _text_blocks(page):
+    """
+    Yield (y0, y1, text) for each text block on the page, with the span
+    text of each line joined and the lines joined by newlines.
+    """
+    for block in page.get_text("dict").get("blocks", []):
+        if block["type"] != 0:  # skip image blocks
+            continue
+        x0, y0, x1, y1 = block["bbox"]
+        yield y0, y1, "\n".join(
+            "".join(span["text"] for span in line["spans"])
+            for line in block["lines"]
+        )
 
-    for page_num in range(DICT_START_PAGE, min(DICT_END_PAGE, len(doc))):
+
+def _scan_pages(doc, start, end):
+    """
+    Scan pages [start, end) with block-level analysis.
+
+    Returns (leading_lines, segments). leading_lines holds the definition
+    lines that come before the first heading in the range -- they continue
+    an entry opened on an earlier page. segments holds one
+    [term, page_num, definition_lines] list per heading, in page order; the
+    last one may still continue past `end`.
+    """
+    # Bind the per-block helpers to locals: they run for every block of
+    # every page, and local lookups are cheaper than global ones.
+    _is_header = is_running_header
+    _is_page_num = is_page_number
+    _detect = detect_entry_heading
+    _content = _content_lines
+
+    leading_lines = []
+    segments = []
+    add_segment = segments.append
+    extend_definition = leading_lines.extend
+
+    for page_num in range(start, end):
         page = doc[page_num]
-        page_dict = page.get_text("dict")
-        blocks = page_dict.get("blocks", [])
+        footer_top = page.rect.height - FOOTER_BAND
 
-        for block in blocks:
-            if block["type"] != 0:  # skip image blocks
+        for y0, y1, block_text in _text_blocks(page):
+            # Skip blocks entirely inside the header/footer margins
+            if y1 < HEADER_BAND or y0 > footer_top:
                 continue
 
             # Get full block text
-            full_text = get_block_text(block).strip()
+            full_text = block_text.strip()
             if not full_text:
                 continue
 
-            first_line = get_block_first_line(block)
+            block_lines = block_text.split("\n")
+            first_line = block_lines[0].strip()
             if not first_line:
                 continue
 
             # Skip ALL-CAPS running headers (entire block is a header)
-            if is_running_header(full_text):
+            if _is_header(full_text):
                 continue
 
             # Skip page numbers
-            if is_page_number(full_text.strip()):
+            if _is_page_num(full_text):
                 continue
 
             # Check if this block starts a new entry
             # CRITICAL: we only check the FIRST LINE of the block
-            detected_term = detect_entry_heading(first_line)
-
-            if detected_term:
-                # Save previous entry
-                if current_term and current_definition_lines:
-                    definition = ' '.join(current_definition_lines)
-                    definition = clean_definition(definition)
-                    if definition:
-                        is_xref = is_cross_reference(definition)
-                        entries.append({
-                            "term": current_term,
-                            "definition": definition,
-                            "page": current_page + 1,  # 1-indexed
-                            "is_cross_ref": is_xref,
-                        })
-
-                # Start new entry
-                current_term = detected_term
-                current_page = page_num
+            heading = _detect(first_line)
 
+            if heading:
+                detected_term, term_end = heading
                 # Extract definition text (everything after the term on first line,
                 # plus all remaining lines in this block)
-                rest_of_first = first_line[len(detected_term):].strip()
-
-                # Get all lines from the block
-                block_lines = []
-                for line_obj in block["lines"]:
-                    lt = ""
-                    for span in line_obj["spans"]:
-                        lt += span["text"]
-                    block_lines.append(lt.strip())
+                rest_of_first = first_line[term_end:].lstrip()
 
                 # First line's remainder is start of definition
                 # Then add lines 2+ from this block
                 def_parts = []
                 if rest_of_first:
                     def_parts.append(rest_of_first)
-                for bl in block_lines[1:]:
-                    if bl and not is_running_header(bl) and not is_page_number(bl):
-                        def_parts.append(bl)
+                def_parts.extend(_content(block_lines[1:]))
 
-                current_definition_lines = def_parts
+                # Start new entry
+                add_segment([detected_term, page_num, def_parts])
+                extend_definition = def_parts.extend
 
             else:
-                # Continuation block for current entry
-                if current_term is not None:
-                    # Add all lines from this block to the definition
-                    for line_obj in block["lines"]:
-                        lt = ""
-                        for span in line_obj["spans"]:
-                            lt += span["text"]
-                        lt = lt.strip()
-                        if lt and not is_running_header(lt) and not is_page_number(lt):
-                            current_definition_lines.append(lt)
+                # Continuation block: add all lines from this block to the
+                # current definition
+                extend_definition(_content(block_lines))
+
+    return leading_lines, segments
+
+
+def _assemble_entries(chunks):
+    """
+    Stitch _scan_pages() results for consecutive page ranges into entries.
+
+    The leading lines of each chunk are appended to the entry left open at
+    the end of the previous one; lines before the very first heading have
+    no entry to belong to and are dropped.
+    """
+    entries = []
+    current = None
+
+    def save(term, page_num, definition_lines):
+        if term and definition_lines:
+            definition = ' '.join(definition_lines)
+            definition = clean_definition(definition)
+            if definition:
+                is_xref = is_cross_reference(definition)
+                entries.append({
+                    "term": term,
+                    "definition": definition,
+                    "page": page_num + 1,  # 1-indexed
+                    "is_cross_ref": is_xref,
+                })
+
+    for leading_lines, segments in chunks:
+        if current is not None:
+            current[2].extend(leading_lines)
+        for segment in segments:
+            # Save previous entry
+            if current is not None:
+                save(*current)
+            current = segment
 
     # Don't forget the last entry
-    if current_term and current_definition_lines:
-        definition = ' '.join(current_definition_lines)
-        definition = clean_definition(definition)
-        if definition:
-            is_xref = is_cross_reference(definition)
-            entries.append({
-                "term": current_term,
-                "definition": definition,
-                "page": current_page + 1,
-                "is_cross_ref": is_xref,
-            })
+    if current is not None:
+        save(*current)
 
     return entries
 
 
+def extract_entries(doc):
+    """Extract all dictionary entries from the PDF using block-level analysis."""
+    end = min(DICT_END_PAGE, len(doc))
+    return _assemble_entries([_scan_pages(doc, DICT_START_PAGE, end)])
+
+
+def _extract_chunk(page_range):
+    """Pool worker: scan one page range using its own document handle."""
+    start, end = page_range
+    doc = fitz.open(PDF_PATH)
+    try:
+        return _scan_pages(doc, start, end)
+    finally:
+        doc.close()
+
+
+def extract_entries_parallel(page_count, processes=None):
+    """
+    Same as extract_entries(), but scans PAGES_PER_CHUNK-page ranges in
+    worker processes. Pages are independent apart from definitions that run
+    across a page break, which _assemble_entries() stitches back together.
+    """
+    end = min(DICT_END_PAGE, page_count)
+    ranges = [
+        (start, min(start + PAGES_PER_CHUNK, end))
+        for start in range(DICT_START_PAGE, end, PAGES_PER_CHUNK)
+    ]
+    with Pool(processes) as pool:
+        chunks = pool.map(_extract_chunk, ranges)
+    return _assemble_entries(chunks)
+
+
 def clean_definition(text):
     """Clean up extracted definition text."""
-    # Normalize whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
-    # Remove soft hyphens
-    text = text.replace('\xad', '').replace('\u00ad', '')
-    # Fix common OCR artifacts
-    text = text.replace('  ', ' ')
-    return text
+    # Remove soft hyphens, then normalize whitespace (this also collapses
+    # the double spaces a removed hyphen can leave behind)
+    return _WS.sub(' ', text.translate(_SOFT_HYPHEN_TABLE)).strip()
 
 
 def is_cross_reference(definition):
     """Check if a definition is just a cross-reference."""
     d = definition.strip()
     # "See halo." or "See under almond." or "(see also simurg)"
-    if re.match(r'^[Ss]ee\s+', d) and len(d) < 120:
+    if _SEE_START.match(d) and len(d) < 120:
         return True
-    if re.match(r'^\([Ss]ee\s+', d) and len(d) < 120:
+    if _PAREN_SEE_START.match(d) and len(d) < 120:
         return True
     return False
 
@@ -403,26 +581,12 @@ def is_cross_reference(definition):
 def post_process_entries(entries):
     """Clean up and validate extracted entries."""
     cleaned = []
-    seen_terms = set()
-
-    # Additional single-word exclusions: common English words that are
-    # definitely not symbol headwords (caught at post-processing stage)
-    SINGLE_WORD_EXCLUSIONS = {
-        "very", "also", "just", "even", "still", "yet", "only",
-        "often", "always", "never", "rather", "quite",
-        "traditional", "finally", "similarly", "conversely",
-        "originally", "essentially", "generally", "consequently",
-        "alternatively", "accordingly", "subsequently", "nevertheless",
-        "furthermore", "moreover", "whereas", "whereby", "thereby",
-        "nonetheless", "otherwise", "indeed", "certainly",
-        "perhaps", "probably", "possibly", "apparently", "recently",
-        "clearly", "obviously", "simply", "merely", "purely",
-        "primarily", "mainly", "largely", "partly", "partly",
-        "already", "sometimes", "everywhere", "anywhere", "nowhere",
-    }
+    definition_parts = []  # per cleaned entry: definition + merged continuations
+    term_index = {}  # lowercase term -> index of its entry in `cleaned`
 
     for entry in entries:
         term = entry["term"]
+        term_lower = term.lower()
         definition = entry["definition"]
 
         # Skip very short or garbage terms
@@ -441,39 +605,69 @@ def post_process_entries(entries):
         if len(term) > 60:
             continue
 
-        # Skip single-word terms that are common English (not symbols)
-        if len(term.split()) == 1 and term.lower() in SINGLE_WORD_EXCLUSIONS:
+        # Skip single-word terms that are common English (not symbols).
+        # The exclusions are all single words, so set membership implies it.
+        if term_lower in SINGLE_WORD_EXCLUSIONS:
             continue
 
         # Re-validate term structure (catches edge cases missed earlier)
-        if not _is_valid_term(term):
+        if not _is_valid_term_lower(term_lower):
             continue
 
         # Skip duplicate terms (keep first occurrence)
-        term_lower = term.lower()
-        if term_lower in seen_terms:
+        if term_lower in term_index:
             # Might be a continuation - append to previous entry
-            for prev in reversed(cleaned):
-                if prev["term"].lower() == term_lower:
-                    prev["definition"] += " " + definition
-                    break
+            definition_parts[term_index[term_lower]].append(definition)
             continue
-        seen_terms.add(term_lower)
+        term_index[term_lower] = len(cleaned)
 
         cleaned.append(entry)
+        definition_parts.append([definition])
+
+    # Join merged continuations once rather than growing the string per merge
+    for entry, parts in zip(cleaned, definition_parts):
+        if len(parts) > 1:
+            entry["definition"] = " ".join(parts)
 
     return cleaned
 
 
+def _dumps(data):
+    """Serialize data as pretty-printed UTF-8 JSON, using orjson if installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def _write_json(f, metadata, entries):
+    """
+    Write {"metadata": ..., "entries": [...]} to binary file f one entry at
+    a time, so the whole document never exists as a single string. The
+    layout is byte-for-byte what one indent=2 dump of the dict would give.
+    """
+    f.write(b'{\n  "metadata": ')
+    f.write(_dumps(metadata).replace(b"\n", b"\n  "))
+    f.write(b',\n  "entries": [')
+    separator = b"\n    "
+    for entry in entries:
+        f.write(separator)
+        f.write(_dumps(entry).replace(b"\n", b"\n    "))
+        separator = b",\n    "
+    # An empty list is dumped as "[]"
+    f.write(b"]\n}" if separator == b"\n    " else b"\n  ]\n}")
+
+
 def main():
     print(f"Opening PDF: {PDF_PATH}")
     doc = fitz.open(PDF_PATH)
-    print(f"  Total pages: {len(doc)}")
-    print(f"  Extracting pages {DICT_START_PAGE+1}-{min(DICT_END_PAGE, len(doc))}")
+    page_count = len(doc)
+    doc.close()
+    print(f"  Total pages: {page_count}")
+    print(f"  Extracting pages {DICT_START_PAGE+1}-{min(DICT_END_PAGE, page_count)}")
     print()
 
     # Extract entries
-    entries = extract_entries(doc)
+    entries = extract_entries_parallel(page_count)
     print(f"  Raw entries extracted: {len(entries)}")
 
     # Post-process
@@ -512,24 +706,19 @@ def main():
         print(f"  p.{e['page']:4d}  {e['term'][:35]:35s}{xr}  {defn}...")
 
     # Save output
-    data = {
-        "metadata": {
-            "source": "Dictionary of Symbols (reprint edition)",
-            "total_entries": len(entries),
-            "entries_with_definitions": defs,
-            "cross_references": xrefs,
-        },
-        "entries": entries,
+    metadata = {
+        "source": "Dictionary of Symbols (reprint edition)",
+        "total_entries": len(entries),
+        "entries_with_definitions": defs,
+        "cross_references": xrefs,
     }
 
-    with open(OUTPUT_PATH, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    with open(OUTPUT_PATH, "wb") as f:
+        _write_json(f, metadata, entries)
 
     print(f"\nOutput: {OUTPUT_PATH}")
     print(f"  File size: {os.path.getsize(OUTPUT_PATH) / 1024:.0f} KB")
 
-    doc.close()
-
 
 if __name__ == "__main__":
     main()
@@ -10,43 +10,86 @@ Reads: symbols_dictionary.json
 Outputs: symbols_dictionary.html
 """
 
+import io
 import json
 import os
 import html as html_module
 import re
+from functools import lru_cache
+
+try:
+    import ijson  # optional: incremental JSON parser (uses yajl2_c when built)
+except ImportError:
+    ijson = None
+
+try:
+    import orjson  # optional: much faster JSON encoder
+except ImportError:
+    orjson = None
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 DICT_PATH = os.path.join(SCRIPT_DIR, "symbols_dictionary.json")
 OUTPUT_PATH = os.path.join(SCRIPT_DIR, "symbols_dictionary.html")
 
 
+class _SlugTable(dict):
+    """Translate table: ASCII letters/digits map to themselves, all else to '-'."""
+
+    def __missing__(self, key):
+        return 0x2D  # ord("-")
+
+
+_SLUG_TABLE = _SlugTable((ord(c), ord(c)) for c in "abcdefghijklmnopqrstuvwxyz0123456789")
+_DASH_RE = re.compile(r"-+")
+
+
+@lru_cache(maxsize=None)
 def slugify(text):
     """Create a URL-safe slug from text."""
-    slug = text.lower().strip()
-    slug = re.sub(r"[^a-z0-9]+", "-", slug)
-    slug = slug.strip("-")
-    return slug
+    slug = text.lower().translate(_SLUG_TABLE)
+    return _DASH_RE.sub("-", slug).strip("-")
 
 
-def generate_html(entries):
-    """Generate the complete HTML page (no images)."""
+def _dumps(data):
+    """Compact JSON (non-ASCII kept as-is) for embedding in the page."""
+    if orjson is not None:
+        return orjson.dumps(data).decode("utf-8")
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
 
-    # Prepare entry data for JavaScript
-    js_entries = []
-    for entry in entries:
-        term = entry["term"]
-        js_entries.append({
-            "term": term,
-            "definition": entry["definition"],
-            "is_cross_ref": entry["is_cross_ref"],
-            "page": entry.get("page", 0),
-            "slug": slugify(term),
-            "letter": term[0].upper() if term else "?",
-        })
-
-    entries_json = json.dumps(js_entries, ensure_ascii=False)
-
-    html_content = f"""<!DOCTYPE html>
+
+def _script_json(data):
+    """_dumps for a <script> element: no '<', so no </script> or <!--."""
+    return _dumps(data).replace("<", "\\u003c")
+
+
+def _letter(term):
+    """Section letter for a term."""
+    return term[0].upper() if term else "?"
+
+
+def stream_entries(path):
+    """Yield the entries of a dictionary JSON file one at a time."""
+    if ijson is None:
+        with open(path, "r", encoding="utf-8") as f:
+            yield from json.load(f)["entries"]
+        return
+    with open(path, "rb") as f:
+        yield from ijson.items(f, "entries.item")
+
+
+def _pack_bits(flags):
+    """Hex string of flags, bit i of byte i // 8 holding flags[i]."""
+    packed = bytearray((len(flags) + 7) // 8)
+    for i, flag in enumerate(flags):
+        if flag:
+            packed[i >> 3] |= 1 << (i & 7)
+    return packed.hex()
+
+
+def _page_parts():
+    """Return the page HTML split around the embedded JSON data."""
+
+    page_head = f"""<!DOCTYPE html>
 <html lang="en">
 <head>
 <meta charset="UTF-8">
@@ -802,6 +845,18 @@ main {{
     .inspire-buttons {{ flex-direction: column; }}
 }}
 
+/* === MODE VISIBILITY === */
+body:not([data-mode="dictionary"]) #dict-controls,
+body:not([data-mode="dictionary"]) #alpha-nav,
+body:not([data-mode="dictionary"]) #dictionary-container {{
+    display: none;
+}}
+
+body[data-mode="quiz"] #quiz-container,
+body[data-mode="inspire"] #inspire-container {{
+    display: block;
+}}
+
 /* === PRINT === */
 @media print {{
     .site-header, .alpha-nav, .controls, .mode-toggle, #quiz-container, #inspire-container {{
@@ -822,20 +877,20 @@ main {{
 .hidden {{ display: none !important; }}
 </style>
 </head>
-<body>
+<body data-mode="dictionary">
 
 <header class="site-header">
     <h1>Dictionary of Symbols</h1>
     <p class="subtitle">Based on the work by Jean Chevalier &amp; Alain Gheerbrant</p>
 
-    <div class="mode-toggle">
-        <button class="mode-btn active" id="btn-dictionary" onclick="switchMode('dictionary')">Dictionary</button>
-        <button class="mode-btn" id="btn-quiz" onclick="switchMode('quiz')">Quiz</button>
-        <button class="mode-btn" id="btn-inspire" onclick="switchMode('inspire')">Inspire</button>
+    <div class="mode-toggle" id="mode-toggle">
+        <button class="mode-btn active" id="btn-dictionary" data-mode="dictionary">Dictionary</button>
+        <button class="mode-btn" id="btn-quiz" data-mode="quiz">Quiz</button>
+        <button class="mode-btn" id="btn-inspire" data-mode="inspire">Inspire</button>
     </div>
 
     <div class="controls" id="dict-controls">
-        <input type="text" id="search" placeholder="Search terms or definitions..." oninput="filterEntries()">
+        <input type="text" id="search" placeholder="Search terms or definitions..." oninput="scheduleFilter()">
         <select id="filter" onchange="filterEntries()">
             <option value="all">All Entries</option>
             <option value="definitions">Definitions Only</option>
@@ -880,6 +935,8 @@ main {{
     </div>
 
     <div id="inspire-symbols" class="inspire-symbols"></div>
+    <template id="inspire-card-tpl"><div class="inspire-symbol-card"><h4></h4><p></p></div></template>
+    <template id="inspire-copy-tpl"><div class="narrative-copy-row"><button class="copy-btn" onclick="copyNarrative(event)">&#x2398; Copy</button></div></template>
 
     <div id="inspire-loading" class="inspire-loading" style="display:none">
         <div class="inspire-spinner"></div>
@@ -907,11 +964,34 @@ main {{
     </div>
 </div>
 
+<script type="application/json" id="dictionary-data">"""
+
+    page_tail = f"""</script>
 <script>
 // ============================================================
 // DATA
 // ============================================================
-const ENTRIES = {entries_json};
+// Parsed from the inert JSON block above: JSON.parse is much cheaper
+// than compiling the same data as a JS literal.
+const DATA = JSON.parse(document.getElementById('dictionary-data').textContent);
+const DEFS = DATA.defs;
+const TERMS = DATA.terms;
+const TERMS_HTML = DATA.terms_html;
+const SLUGS = DATA.slugs;
+const PAGE = Uint16Array.from(DATA.pages);
+const ENTRIES_BY_LETTER = DATA.by_letter;
+const IS_XREF_BITS = DATA.xref_bits;
+
+const ENTRY_COUNT = TERMS.length;
+
+// Cross-reference flags arrive bit-packed as hex; expand to one byte per entry
+const IS_XREF = new Uint8Array(ENTRY_COUNT);
+for (let i = 0; i < ENTRY_COUNT; i++) {{
+    IS_XREF[i] = (parseInt(IS_XREF_BITS.substr((i >> 3) * 2, 2), 16) >> (i & 7)) & 1;
+}}
+
+// Section letters aren't shipped; derive them once (same rule as Python)
+const LETTERS = TERMS.map(t => t.charAt(0).toUpperCase() || '?');
 
 // ============================================================
 // STATE
@@ -920,74 +1000,244 @@ let currentMode = 'dictionary';
 let currentLetter = null;
 let quizCorrect = 0;
 let quizTotal = 0;
-let quizUsed = new Set();
-let currentQuizEntry = null;
+let quizDeck = [];
+let deckPos = 0;
+let currentQuizId = null;
+let filterFrame = 0;
+let modalOpen = false;
+let apiKeySave = 0;
+let pendingApiKey = '';
 
 // Only entries with definitions (not cross-references) for quiz
-const quizEntries = ENTRIES.filter(e => !e.is_cross_ref && e.definition.length > 50);
+const quizIds = [];
+for (let i = 0; i < ENTRY_COUNT; i++) {{
+    if (!IS_XREF[i] && DEFS[i].length > 50) quizIds.push(i);
+}}
+
+// Scratch id array for drawing wrong answers; its order is irrelevant
+const wrongPool = quizIds.slice();
 
-// Entries pool for Inspire mode (same filter)
-const inspireEntries = quizEntries;
+// Entries pool for Inspire mode (same filter), sampled in place like wrongPool
+const inspirePool = quizIds.slice();
 let inspireSymbols = [];
 
+// ============================================================
+// DOM
+// ============================================================
+// Fixed elements, looked up once (the script runs after the markup)
+const DOM = {{
+    alphaNav: document.getElementById('alpha-nav'),
+    btnDict: document.getElementById('btn-dictionary'),
+    btnInspire: document.getElementById('btn-inspire'),
+    btnQuiz: document.getElementById('btn-quiz'),
+    dictContainer: document.getElementById('dictionary-container'),
+    filter: document.getElementById('filter'),
+    inspireApiKey: document.getElementById('inspire-api-key'),
+    inspireCardTpl: document.getElementById('inspire-card-tpl'),
+    inspireCopyTpl: document.getElementById('inspire-copy-tpl'),
+    inspireCount: document.getElementById('inspire-count'),
+    inspireError: document.getElementById('inspire-error'),
+    inspireGenerate: document.getElementById('inspire-generate'),
+    inspireLoading: document.getElementById('inspire-loading'),
+    inspireNarrative: document.getElementById('inspire-narrative'),
+    inspireReroll: document.getElementById('inspire-reroll'),
+    inspireSymbols: document.getElementById('inspire-symbols'),
+    modalDef: document.getElementById('modal-definition'),
+    modalOverlay: document.getElementById('modal-overlay'),
+    modalPage: document.getElementById('modal-page'),
+    modalTerm: document.getElementById('modal-term'),
+    modeToggle: document.getElementById('mode-toggle'),
+    quizDef: document.getElementById('quiz-definition'),
+    quizNext: document.getElementById('quiz-next'),
+    quizOptions: document.getElementById('quiz-options'),
+    quizScore: document.getElementById('quiz-score'),
+    search: document.getElementById('search'),
+    stats: document.getElementById('stats'),
+}};
+
 // ============================================================
 // UTILITY
 // ============================================================
+const ESC = {{ '&': '&amp;', '<': '&lt;', '>': '&gt;' }};
+const ESC_RE = /[&<>]/g;
+const NEEDS_ESC = /[&<>]/;
+
 function escapeHtml(str) {{
-    const div = document.createElement('div');
-    div.textContent = str;
-    return div.innerHTML;
+    // Most text has nothing to escape; hand it back without a replace pass
+    return NEEDS_ESC.test(str) ? str.replace(ESC_RE, c => ESC[c]) : str;
 }}
 
+const SEE_RE = /\\(see\\s+(?:also\\s+)?([^)]+)\\)/gi;
+
 function processDefinition(text) {{
     let escaped = escapeHtml(text);
     // Convert (see also term) and (see term) to clickable links
-    escaped = escaped.replace(/\\(see\\s+(?:also\\s+)?([^)]+)\\)/gi, function(match, terms) {{
+    escaped = escaped.replace(SEE_RE, function(match, terms) {{
         const parts = terms.split(/[;,]/).map(t => t.trim()).filter(t => t);
-        const links = parts.map(t => {{
-            const slug = t.toLowerCase().replace(/[^a-z0-9]+/g, '-').replace(/^-|-$/g, '');
-            return '<a href="#term-' + slug + '" class="xref-link">' + t + '</a>';
-        }});
+        const links = parts.map(t => '<a href="#term-' + cachedSlug(t) + '" class="xref-link">' + t + '</a>');
         return '(see ' + (match.toLowerCase().includes('also') ? 'also ' : '') + links.join('; ') + ')';
     }});
     return escaped;
 }}
 
+const SLUG_NON_ALNUM = /[^a-z0-9]+/g;
+const SLUG_EDGE_DASH = /^-|-$/g;
+
+// Definitions never change at runtime, so each entry is rendered once
+const RENDERED_HTML = new Array(ENTRY_COUNT);
+
+function renderEntry(id) {{
+    if (RENDERED_HTML[id] === undefined) {{
+        RENDERED_HTML[id] = processDefinition(DEFS[id]);
+    }}
+    return RENDERED_HTML[id];
+}}
+
 function slugify(text) {{
-    return text.toLowerCase().replace(/[^a-z0-9]+/g, '-').replace(/^-|-$/g, '');
+    return text.toLowerCase().replace(SLUG_NON_ALNUM, '-').replace(SLUG_EDGE_DASH, '');
+}}
+
+// Cross-references mostly point at known terms, so seed the cache with the
+// slugs already shipped in SLUGS and only fall back to slugify on a miss.
+const SLUG_CACHE = new Map();
+TERMS.forEach((t, id) => {{ SLUG_CACHE.set(t, SLUGS[id]); }});
+
+function cachedSlug(text) {{
+    let slug = SLUG_CACHE.get(text);
+    if (slug === undefined) {{
+        slug = slugify(text);
+        SLUG_CACHE.set(text, slug);
+    }}
+    return slug;
 }}
 
 // ============================================================
 // QUIZ TERM REDACTION
 // ============================================================
-function redactTermFromDefinition(text, term) {{
-    if (!term || !text) return text;
+// The quiz hides the term with a hand-rolled scanner that gives the same
+// result as the old \\b(?:term|words...)(?:e?s)?(?:'s|s')?\\b /gi RegExp:
+// needles are tried longest-pattern first, suffixes in backtracking order.
+// Everything works on UTF-16 code units folded the way /i folds them.
+const REDACT_SUFFIXES = ["es's", "ess'", 'es', "s's", "ss'", 's', "'s", "s'", ''].map(foldCodes);
+const REDACT_NEEDLES = new Map();
+const SPACE_CHAR = /\\s/;
 
-    const escapeRegex = (s) => s.replace(/[.*+?^${{}}()|[\\]\\\\]/g, '\\\\$&');
+function foldCode(c) {{
+    if (c < 128) return c >= 97 && c <= 122 ? c - 32 : c;
+    const u = String.fromCharCode(c).toUpperCase();
+    return u.length === 1 && u.charCodeAt(0) >= 128 ? u.charCodeAt(0) : c;
+}}
+
+function foldCodes(s) {{
+    const codes = [];
+    for (let i = 0; i < s.length; i++) codes.push(foldCode(s.charCodeAt(i)));
+    return codes;
+}}
 
-    const patterns = [];
+// \\w and \\s without the u flag
+function isWordCode(c) {{
+    return (c >= 48 && c <= 57) || (c >= 65 && c <= 90) || (c >= 97 && c <= 122) || c === 95;
+}}
 
-    // Full term pattern (flexible whitespace for multi-word)
-    const fullPattern = escapeRegex(term).replace(/\\s+/g, '\\\\s+');
-    patterns.push(fullPattern);
+function isSpaceCode(c) {{
+    return c === 32 || (c >= 9 && c <= 13) || (c >= 128 && SPACE_CHAR.test(String.fromCharCode(c)));
+}}
+
+// Needles for a term: each is a list of folded words separated by \\s+
+function compileNeedles(term) {{
+    const escapeRegex = (s) => s.replace(/[.*+?^${{}}()|[\\]\\\\]/g, '\\\\$&');
+
+    // Full term (flexible whitespace for multi-word), keyed by pattern length
+    const patterns = [{{ key: escapeRegex(term).replace(/\\s+/g, '\\\\s+'), words: term.split(/\\s+/) }}];
 
     // For multi-word terms, also redact individual words >= 4 chars
     const words = term.split(/\\s+/);
     if (words.length > 1) {{
         words.forEach(w => {{
             if (w.length >= 4) {{
-                patterns.push(escapeRegex(w));
+                patterns.push({{ key: escapeRegex(w), words: [w] }});
             }}
         }});
     }}
 
-    // Sort longest-first, add suffix variants for plurals/possessives
-    patterns.sort((a, b) => b.length - a.length);
-    const suffixed = patterns.map(p => p + "(?:e?s)?(?:'s|s')?");
-    const combined = '\\\\b(?:' + suffixed.join('|') + ')\\\\b';
-    const regex = new RegExp(combined, 'gi');
+    patterns.sort((a, b) => b.key.length - a.key.length);
+    const needles = patterns.map(p => p.words.map(foldCodes));
+
+    // ASCII code units a match can start with; non-ASCII starts, or a
+    // needle that opens with whitespace, make every position a candidate
+    let first = new Uint8Array(128);
+    needles.forEach(words => {{
+        const c = words[0].length ? words[0][0] : -1;
+        if (c < 0 || c >= 128) first = null;
+        else if (first) {{
+            first[c] = 1;
+            if (c >= 65 && c <= 90) first[c + 32] = 1;
+        }}
+    }});
+    return {{ needles, first }};
+}}
+
+function isBoundary(text, i) {{
+    const before = i > 0 && isWordCode(text.charCodeAt(i - 1));
+    const after = i < text.length && isWordCode(text.charCodeAt(i));
+    return before !== after;
+}}
+
+// End of folded literal lit matched at text[i], or -1
+function matchLiteral(text, i, lit) {{
+    if (i + lit.length > text.length) return -1;
+    for (let k = 0; k < lit.length; k++) {{
+        const c = text.charCodeAt(i + k);
+        if (c !== lit[k] && foldCode(c) !== lit[k]) return -1;
+    }}
+    return i + lit.length;
+}}
+
+// End of the first needle (plus suffix) matching at pos, or -1
+function matchNeedles(text, pos, needles) {{
+    for (const words of needles) {{
+        let i = matchLiteral(text, pos, words[0]);
+        for (let w = 1; w < words.length && i >= 0; w++) {{
+            const start = i;
+            while (i < text.length && isSpaceCode(text.charCodeAt(i))) i++;
+            i = i === start ? -1 : matchLiteral(text, i, words[w]);
+        }}
+        if (i < 0) continue;
+        for (const suffix of REDACT_SUFFIXES) {{
+            const end = matchLiteral(text, i, suffix);
+            if (end >= 0 && isBoundary(text, end)) return end;
+        }}
+    }}
+    return -1;
+}}
 
-    return text.replace(regex, '\\u2588\\u2588\\u2588\\u2588\\u2588\\u2588');
+function redactTermFromDefinition(text, term) {{
+    if (!term || !text) return text;
+
+    let compiled = REDACT_NEEDLES.get(term);
+    if (!compiled) {{
+        compiled = compileNeedles(term);
+        REDACT_NEEDLES.set(term, compiled);
+    }}
+    const {{ needles, first }} = compiled;
+
+    let out = '';
+    let last = 0;
+    let pos = 0;
+    while (pos < text.length) {{
+        const c = text.charCodeAt(pos);
+        let end = -1;
+        if ((!first || (c < 128 && first[c])) && isBoundary(text, pos)) {{
+            end = matchNeedles(text, pos, needles);
+        }}
+        if (end > pos) {{
+            out += text.slice(last, pos) + '\\u2588\\u2588\\u2588\\u2588\\u2588\\u2588';
+            last = pos = end;
+        }} else {{
+            pos++;
+        }}
+    }}
+    return out + text.slice(last);
 }}
 
 function processDefinitionForQuiz(text, term) {{
@@ -997,62 +1247,172 @@ function processDefinitionForQuiz(text, term) {{
     return html;
 }}
 
+// Redaction is deterministic per entry, so later rounds reuse the markup
+const QUIZ_HTML = new Array(ENTRY_COUNT);
+
+function renderQuizEntry(id) {{
+    if (QUIZ_HTML[id] === undefined) {{
+        QUIZ_HTML[id] = processDefinitionForQuiz(DEFS[id], TERMS[id]);
+    }}
+    return QUIZ_HTML[id];
+}}
+
+// ============================================================
+// SEARCH INDEX
+// ============================================================
+// Lowercased card text per entry, built on the first search rather than
+// shipped. A plain substring scan over 1340 strings stays well under the
+// cost of building and probing a trigram index.
+let searchHay = null;
+
+function plainDefinition(text) {{
+    // Text content of processDefinition(text), without the markup
+    return text.replace(SEE_RE, function(match, terms) {{
+        const parts = terms.split(/[;,]/).map(t => t.trim()).filter(t => t);
+        return '(see ' + (match.toLowerCase().includes('also') ? 'also ' : '') + parts.join('; ') + ')';
+    }});
+}}
+
+function buildSearchHay() {{
+    return TERMS.map((t, id) => (t + plainDefinition(DEFS[id]) + 'p. ' + PAGE[id]).toLowerCase());
+}}
+
+// Ids of entries whose card text contains query (already lowercased)
+function searchEntries(query) {{
+    if (!searchHay) searchHay = buildSearchHay();
+    const hay = searchHay;
+    const matches = new Set();
+    for (let id = 0; id < hay.length; id++) {{
+        if (hay[id].includes(query)) matches.add(id);
+    }}
+    return matches;
+}}
+
 // ============================================================
 // DICTIONARY MODE
 // ============================================================
+// Cards are rendered a letter at a time, the first time a section is
+// needed; until then cardEls[id] is undefined and cardShown[id] records
+// the visibility the card should get when it is built.
+const cardEls = [];
+const cardShown = new Uint8Array(ENTRY_COUNT).fill(1);
+const visibleMask = new Uint8Array(ENTRY_COUNT);
+const renderedLetters = new Set();
+const sectionEls = {{}};
+let sectionObserver = null;
+
+// Rough card-grid height so unrendered sections keep the page scrollable
+function placeholderHeight(count) {{
+    return Math.ceil(count / 3) * 220;
+}}
+
 function buildDictionary() {{
-    const container = document.getElementById('dictionary-container');
-    const nav = document.getElementById('alpha-nav');
-
-    // Group entries by first letter
-    const groups = {{}};
-    ENTRIES.forEach(e => {{
-        const letter = e.letter;
-        if (!groups[letter]) groups[letter] = [];
-        groups[letter].push(e);
-    }});
+    const container = DOM.dictContainer;
+    const nav = DOM.alphaNav;
 
     // Build alpha nav
     const letters = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'.split('');
-    nav.innerHTML = '<button class="alpha-btn active" onclick="filterByLetter(null)">ALL</button>';
+    const navFrag = document.createDocumentFragment();
+    const allBtn = document.createElement('button');
+    allBtn.className = 'alpha-btn active';
+    allBtn.textContent = 'ALL';
+    navFrag.appendChild(allBtn);
     letters.forEach(l => {{
-        const has = groups[l] && groups[l].length > 0;
-        const cls = has ? 'alpha-btn' : 'alpha-btn disabled';
-        const onclick = has ? `onclick="filterByLetter('${{l}}')"` : '';
-        nav.innerHTML += `<button class="${{cls}}" ${{onclick}}>${{l}}</button>`;
+        const btn = document.createElement('button');
+        btn.textContent = l;
+        btn.className = ENTRIES_BY_LETTER[l] ? 'alpha-btn' : 'alpha-btn disabled';
+        navFrag.appendChild(btn);
     }});
+    nav.replaceChildren(navFrag);
+
+    // Build empty sections; cards are filled in by renderLetter
+    const parts = [];
+    for (const [letter, ids] of Object.entries(ENTRIES_BY_LETTER)) {{
+        parts.push(`<section class="letter-section" data-letter="${{letter}}" id="section-${{letter}}">`);
+        parts.push(`<h2 class="letter-heading">${{letter}}</h2>`);
+        parts.push(`<div class="card-grid" style="min-height: ${{placeholderHeight(ids.length)}}px"></div>`);
+        parts.push('</section>');
+    }}
+    container.innerHTML = parts.join('');
+    for (const section of container.children) {{
+        sectionEls[section.dataset.letter] = section;
+    }}
 
-    // Build card sections
-    let html = '';
-    const sortedLetters = Object.keys(groups).sort();
-    sortedLetters.forEach(letter => {{
-        const entries = groups[letter];
-        html += `<section class="letter-section" data-letter="${{letter}}" id="section-${{letter}}">`;
-        html += `<h2 class="letter-heading">${{letter}}</h2>`;
-        html += '<div class="card-grid">';
-        entries.forEach(e => {{
-            const type = e.is_cross_ref ? 'crossref' : 'definition';
-            html += `<div class="card" data-term="${{escapeHtml(e.term.toLowerCase())}}" data-type="${{type}}" data-letter="${{e.letter}}" id="term-${{e.slug}}" onclick="openModal('${{e.slug}}')">`;
-
-            html += '<div class="card-body">';
-            html += `<h3 class="card-term">${{escapeHtml(e.term)}}</h3>`;
-
-            if (e.is_cross_ref) {{
-                html += `<p class="card-cross-ref">${{processDefinition(e.definition)}}</p>`;
-            }} else {{
-                html += `<div class="card-definition">${{processDefinition(e.definition)}}</div>`;
-            }}
+    if ('IntersectionObserver' in window) {{
+        sectionObserver = new IntersectionObserver(entries => {{
+            entries.forEach(en => {{
+                if (en.isIntersecting) renderLetter(en.target.dataset.letter);
+            }});
+        }}, {{ rootMargin: '800px 0px' }});
+        Object.values(sectionEls).forEach(section => sectionObserver.observe(section));
+    }} else {{
+        Object.keys(ENTRIES_BY_LETTER).forEach(renderLetter);
+    }}
 
-            html += `<div class="card-page">p. ${{e.page}}</div>`;
-            html += '</div></div>';
-        }});
-        html += '</div></section>';
+    updateStats();
+}}
+
+function renderLetter(letter) {{
+    if (renderedLetters.has(letter) || !ENTRIES_BY_LETTER[letter]) return;
+    renderedLetters.add(letter);
+
+    const section = sectionEls[letter];
+    const ids = ENTRIES_BY_LETTER[letter];
+    const parts = [];
+    ids.forEach(id => {{
+        const slug = SLUGS[id];
+        const type = IS_XREF[id] ? 'crossref' : 'definition';
+        const style = cardShown[id] ? '' : ' style="display: none"';
+        parts.push(`<div class="card" data-type="${{type}}" data-letter="${{letter}}" id="term-${{slug}}" data-id="${{id}}"${{style}}>`);
+
+        parts.push('<div class="card-body">');
+        parts.push(`<h3 class="card-term">${{TERMS_HTML[id]}}</h3>`);
+
+        if (IS_XREF[id]) {{
+            parts.push(`<p class="card-cross-ref">${{renderEntry(id)}}</p>`);
+        }} else {{
+            parts.push(`<div class="card-definition">${{renderEntry(id)}}</div>`);
+        }}
+
+        parts.push(`<div class="card-page">p. ${{PAGE[id]}}</div>`);
+        parts.push('</div></div>');
     }});
 
-    container.innerHTML = html;
-    updateStats();
+    const grid = section.querySelector('.card-grid');
+    grid.innerHTML = parts.join('');
+    grid.style.minHeight = '';
+
+    // Cards were emitted in id order; remember each one by entry id
+    const cards = grid.children;
+    ids.forEach((id, k) => {{ cardEls[id] = cards[k]; }});
+
+    if (sectionObserver) sectionObserver.unobserve(section);
+}}
+
+// Slug -> entry id, built on the first #term-... link that needs it
+let idBySlug = null;
+
+function idForSlug(slug) {{
+    if (!idBySlug) {{
+        idBySlug = new Map();
+        SLUGS.forEach((s, id) => {{ idBySlug.set(s, id); }});
+    }}
+    return idBySlug.get(slug);
 }}
 
+// Make sure the target of an in-page #term-... link exists before the
+// browser tries to scroll to it
+function renderForHash(hash) {{
+    if (!hash.startsWith('#term-')) return;
+    const id = idForSlug(hash.slice(6));
+    if (id !== undefined) renderLetter(LETTERS[id]);
+}}
+
+document.addEventListener('click', function(ev) {{
+    const link = ev.target.closest('a.xref-link');
+    if (link) renderForHash(link.getAttribute('href'));
+}}, true);
+
 function filterByLetter(letter) {{
     currentLetter = letter;
 
@@ -1067,117 +1427,142 @@ function filterByLetter(letter) {{
 
     // Scroll to section
     if (letter) {{
-        const section = document.getElementById('section-' + letter);
+        renderLetter(letter);
+        const section = sectionEls[letter];
         if (section) {{
             section.scrollIntoView({{ behavior: 'smooth', block: 'start' }});
         }}
     }}
 }}
 
+// Coalesce keystrokes so at most one filter pass runs per frame
+function scheduleFilter() {{
+    if (filterFrame) return;
+    filterFrame = requestAnimationFrame(() => {{
+        filterFrame = 0;
+        filterEntries();
+    }});
+}}
+
 function filterEntries() {{
-    const query = document.getElementById('search').value.toLowerCase();
-    const filterType = document.getElementById('filter').value;
-    let visible = 0;
-    let total = 0;
+    const query = DOM.search.value.toLowerCase();
+    const filterType = DOM.filter.value;
+    const matches = query ? searchEntries(query) : null;
 
-    document.querySelectorAll('.letter-section').forEach(section => {{
-        const sectionLetter = section.dataset.letter;
-        let sectionVisible = 0;
+    // Pass 1: decide every entry's visibility without touching the DOM
+    for (let id = 0; id < ENTRY_COUNT; id++) {{
+        let show = 1;
+
+        // Type filter
+        if (filterType === 'definitions' && IS_XREF[id]) show = 0;
+        if (filterType === 'crossrefs' && !IS_XREF[id]) show = 0;
+
+        // Search filter
+        if (matches && show && !matches.has(id)) show = 0;
+
+        visibleMask[id] = show;
+    }}
+
+    // Pass 2: write only the cards whose visibility changed
+    for (let id = 0; id < ENTRY_COUNT; id++) {{
+        const show = visibleMask[id];
+        if (show === cardShown[id]) continue;
+        cardShown[id] = show;
+        if (cardEls[id]) cardEls[id].style.display = show ? '' : 'none';
+    }}
+
+    let visible = 0;
+    for (const [sectionLetter, ids] of Object.entries(ENTRIES_BY_LETTER)) {{
+        const section = sectionEls[sectionLetter];
 
         // Letter filter
         if (currentLetter && sectionLetter !== currentLetter) {{
             section.classList.add('hidden');
-            return;
+            continue;
         }}
-        section.classList.remove('hidden');
-
-        section.querySelectorAll('.card').forEach(card => {{
-            total++;
-            let show = true;
 
-            // Type filter
-            if (filterType === 'definitions' && card.dataset.type !== 'definition') show = false;
-            if (filterType === 'crossrefs' && card.dataset.type !== 'crossref') show = false;
-
-            // Search filter
-            if (query && show) {{
-                const term = card.dataset.term;
-                const text = card.textContent.toLowerCase();
-                if (!term.includes(query) && !text.includes(query)) show = false;
-            }}
+        let sectionVisible = 0;
+        ids.forEach(id => {{ sectionVisible += visibleMask[id]; }});
+        visible += sectionVisible;
 
-            card.style.display = show ? '' : 'none';
-            if (show) {{ visible++; sectionVisible++; }}
-        }});
+        if (!renderedLetters.has(sectionLetter)) {{
+            section.lastElementChild.style.minHeight = placeholderHeight(sectionVisible) + 'px';
+        }}
 
         // Hide section header if no cards visible
-        if (sectionVisible === 0 && (query || filterType !== 'all')) {{
-            section.classList.add('hidden');
-        }}
-    }});
+        section.classList.toggle('hidden', sectionVisible === 0 && (query !== '' || filterType !== 'all'));
+    }}
 
     updateStats(visible);
 }}
 
 function updateStats(visible) {{
-    const total = ENTRIES.length;
-    const defs = ENTRIES.filter(e => !e.is_cross_ref).length;
-    const xrefs = ENTRIES.filter(e => e.is_cross_ref).length;
+    const total = ENTRY_COUNT;
+    let xrefs = 0;
+    for (let i = 0; i < ENTRY_COUNT; i++) xrefs += IS_XREF[i];
+    const defs = total - xrefs;
     const showing = visible !== undefined ? visible : total;
-    document.getElementById('stats').textContent =
+    DOM.stats.textContent =
         `Showing ${{showing}} of ${{total}} entries (${{defs}} definitions, ${{xrefs}} cross-references)`;
 }}
 
 // ============================================================
 // QUIZ MODE
 // ============================================================
-function nextQuestion() {{
-    if (quizUsed.size >= quizEntries.length) {{
-        quizUsed.clear();
+function shuffle(arr) {{
+    for (let i = arr.length - 1; i > 0; i--) {{
+        const j = Math.floor(Math.random() * (i + 1));
+        [arr[i], arr[j]] = [arr[j], arr[i]];
     }}
+    return arr;
+}}
 
-    // Pick a random entry not yet used
-    let idx;
-    do {{
-        idx = Math.floor(Math.random() * quizEntries.length);
-    }} while (quizUsed.has(idx));
-    quizUsed.add(idx);
-
-    const correct = quizEntries[idx];
+// Partial Fisher-Yates: move count random elements of arr to its front.
+// Returns how many were drawn (at most arr.length).
+function sampleToFront(arr, count) {{
+    const n = Math.min(count, arr.length);
+    for (let k = 0; k < n; k++) {{
+        const j = k + Math.floor(Math.random() * (arr.length - k));
+        [arr[k], arr[j]] = [arr[j], arr[k]];
+    }}
+    return n;
+}}
 
-    // Pick 3 wrong answers
-    const wrongIndices = new Set();
-    while (wrongIndices.size < 3) {{
-        const wi = Math.floor(Math.random() * quizEntries.length);
-        if (wi !== idx && !wrongIndices.has(wi)) wrongIndices.add(wi);
+function nextQuestion() {{
+    // Walk a shuffled deck so every entry comes up once per round
+    if (deckPos >= quizDeck.length) {{
+        quizDeck = shuffle(quizIds.slice());
+        deckPos = 0;
     }}
+    const correct = quizDeck[deckPos++];
 
+    // Draw 4 from the scratch pool and keep the first 3 that aren't the answer
+    const drawn = sampleToFront(wrongPool, 4);
     const options = [correct];
-    wrongIndices.forEach(wi => options.push(quizEntries[wi]));
-
-    // Shuffle options
-    for (let i = options.length - 1; i > 0; i--) {{
-        const j = Math.floor(Math.random() * (i + 1));
-        [options[i], options[j]] = [options[j], options[i]];
+    for (let k = 0; k < drawn && options.length < 4; k++) {{
+        if (wrongPool[k] !== correct) options.push(wrongPool[k]);
     }}
 
+    shuffle(options);
+
     // Show definition
-    currentQuizEntry = correct;
-    document.getElementById('quiz-definition').innerHTML = processDefinitionForQuiz(correct.definition, correct.term);
+    currentQuizId = correct;
+    DOM.quizDef.innerHTML = renderQuizEntry(correct);
 
     // Show options
-    const optionsDiv = document.getElementById('quiz-options');
-    optionsDiv.innerHTML = '';
+    const optionsDiv = DOM.quizOptions;
+    const frag = document.createDocumentFragment();
     options.forEach(opt => {{
         const btn = document.createElement('button');
         btn.className = 'quiz-option';
-        btn.textContent = opt.term;
-        btn.onclick = function() {{ checkAnswer(this, opt.term, correct.term); }};
-        optionsDiv.appendChild(btn);
+        btn.textContent = TERMS[opt];
+        btn.dataset.id = opt;
+        frag.appendChild(btn);
     }});
+    optionsDiv.replaceChildren(frag);
 
     // Hide next button
-    document.getElementById('quiz-next').style.display = 'none';
+    DOM.quizNext.style.display = 'none';
 
     // Update score display
     updateQuizScore();
@@ -1185,43 +1570,35 @@ function nextQuestion() {{
 
 function checkAnswer(btn, selected, correct) {{
     quizTotal++;
-    const buttons = document.querySelectorAll('.quiz-option');
+    if (selected === correct) quizCorrect++;
 
-    buttons.forEach(b => {{
-        b.classList.add('disabled');
-        b.onclick = null;
-        if (b.textContent === correct) {{
-            b.classList.add('correct');
-        }}
-    }});
-
-    if (selected === correct) {{
-        quizCorrect++;
-        btn.classList.add('correct');
-    }} else {{
-        btn.classList.add('incorrect');
+    // One className write per button, covering the picked one too
+    for (const b of DOM.quizOptions.children) {{
+        if (b.textContent === correct) b.className = 'quiz-option disabled correct';
+        else if (b === btn) b.className = 'quiz-option disabled incorrect';
+        else b.className = 'quiz-option disabled';
     }}
 
     updateQuizScore();
 
     // Un-redact the definition now that the answer is revealed
-    if (currentQuizEntry) {{
-        document.getElementById('quiz-definition').innerHTML = processDefinition(currentQuizEntry.definition);
+    if (currentQuizId !== null) {{
+        DOM.quizDef.innerHTML = renderEntry(currentQuizId);
     }}
 
-    document.getElementById('quiz-next').style.display = 'inline-block';
+    DOM.quizNext.style.display = 'inline-block';
 }}
 
 function updateQuizScore() {{
     const pct = quizTotal > 0 ? Math.round((quizCorrect / quizTotal) * 100) : 0;
-    document.getElementById('quiz-score').textContent =
+    DOM.quizScore.textContent =
         `Score: ${{quizCorrect}} / ${{quizTotal}}${{quizTotal > 0 ? ' (' + pct + '%)' : ''}}`;
 }}
 
 function resetQuiz() {{
     quizCorrect = 0;
     quizTotal = 0;
-    quizUsed.clear();
+    deckPos = quizDeck.length;
     nextQuestion();
 }}
 
@@ -1231,17 +1608,12 @@ function resetQuiz() {{
 function switchMode(mode) {{
     currentMode = mode;
 
-    document.getElementById('btn-dictionary').classList.toggle('active', mode === 'dictionary');
-    document.getElementById('btn-quiz').classList.toggle('active', mode === 'quiz');
-    document.getElementById('btn-inspire').classList.toggle('active', mode === 'inspire');
+    DOM.btnDict.classList.toggle('active', mode === 'dictionary');
+    DOM.btnQuiz.classList.toggle('active', mode === 'quiz');
+    DOM.btnInspire.classList.toggle('active', mode === 'inspire');
 
-    document.getElementById('dictionary-container').style.display = mode === 'dictionary' ? '' : 'none';
-    document.getElementById('dict-controls').style.display = mode === 'dictionary' ? 'flex' : 'none';
-    document.getElementById('alpha-nav').style.display = mode === 'dictionary' ? 'flex' : 'none';
-
-    document.getElementById('quiz-container').style.display = mode === 'quiz' ? 'block' : 'none';
-
-    document.getElementById('inspire-container').style.display = mode === 'inspire' ? 'block' : 'none';
+    // Container visibility is driven by the MODE VISIBILITY rules
+    document.body.dataset.mode = mode;
 
     if (mode === 'quiz') {{
         nextQuestion();
@@ -1254,30 +1626,26 @@ function switchMode(mode) {{
 // ============================================================
 // MODAL / EXPANDED CARD
 // ============================================================
-const entryBySlug = {{}};
-ENTRIES.forEach(e => {{ entryBySlug[e.slug] = e; }});
-
-function openModal(slug) {{
-    const e = entryBySlug[slug];
-    if (!e) return;
+function openModal(id) {{
+    DOM.modalTerm.textContent = TERMS[id];
+    DOM.modalDef.innerHTML = renderEntry(id);
+    DOM.modalPage.textContent = 'p. ' + PAGE[id];
 
-    document.getElementById('modal-term').textContent = e.term;
-    document.getElementById('modal-definition').innerHTML = processDefinition(e.definition);
-    document.getElementById('modal-page').textContent = 'p. ' + e.page;
-
-    document.getElementById('modal-overlay').classList.add('open');
+    modalOpen = true;
+    DOM.modalOverlay.classList.add('open');
     document.body.style.overflow = 'hidden';
 }}
 
 function closeModal(event) {{
     if (event && event.target.closest('.modal-content') && !event.target.closest('.modal-close')) return;
-    document.getElementById('modal-overlay').classList.remove('open');
+    modalOpen = false;
+    DOM.modalOverlay.classList.remove('open');
     document.body.style.overflow = '';
 }}
 
-// Close modal on Escape key
+// Close modal on Escape key; every other keystroke returns on the flag check
 document.addEventListener('keydown', function(ev) {{
-    if (ev.key === 'Escape') closeModal(ev);
+    if (modalOpen && ev.key === 'Escape') closeModal();
 }});
 
 // ============================================================
@@ -1295,8 +1663,8 @@ function flashCopyBtn(btn) {{
 
 function copyDefinition(event) {{
     event.stopPropagation();
-    const term = document.getElementById('modal-term').textContent;
-    const defEl = document.getElementById('modal-definition');
+    const term = DOM.modalTerm.textContent;
+    const defEl = DOM.modalDef;
     const def = defEl.innerText || defEl.textContent;
     const text = term + '\\n\\n' + def;
     navigator.clipboard.writeText(text).then(() => {{
@@ -1306,7 +1674,7 @@ function copyDefinition(event) {{
 
 function copyNarrative(event) {{
     event.stopPropagation();
-    const narEl = document.getElementById('inspire-narrative');
+    const narEl = DOM.inspireNarrative;
     const title = narEl.querySelector('h3')?.textContent || '';
     const body = narEl.querySelector('.narrative-body')?.innerText || '';
     const text = title + '\\n\\n' + body;
@@ -1319,34 +1687,52 @@ function copyNarrative(event) {{
 // INSPIRE MODE
 // ============================================================
 function loadApiKey() {{
+    // A newer key is still waiting to be written; don't put the old one back
+    if (apiKeySave) return;
     const saved = localStorage.getItem('inspire_api_key');
     if (saved) {{
-        document.getElementById('inspire-api-key').value = saved;
+        DOM.inspireApiKey.value = saved;
     }}
 }}
 
+function writeApiKey() {{
+    apiKeySave = 0;
+    localStorage.setItem('inspire_api_key', pendingApiKey);
+}}
+
+function cancelApiKeySave() {{
+    if (window.requestIdleCallback) cancelIdleCallback(apiKeySave);
+    else clearTimeout(apiKeySave);
+}}
+
+// Called per keystroke; only the last value is written, once the page is idle
 function saveApiKey(value) {{
-    localStorage.setItem('inspire_api_key', value.trim());
+    pendingApiKey = value.trim();
+    if (apiKeySave) cancelApiKeySave();
+    apiKeySave = window.requestIdleCallback
+        ? requestIdleCallback(writeApiKey, {{ timeout: 500 }})
+        : setTimeout(writeApiKey, 200);
+}}
+
+// Write a pending key straight away, before the page can be discarded
+function flushApiKey() {{
+    if (!apiKeySave) return;
+    cancelApiKeySave();
+    writeApiKey();
 }}
 
 function toggleApiKeyVisibility() {{
-    const input = document.getElementById('inspire-api-key');
+    const input = DOM.inspireApiKey;
     input.type = input.type === 'password' ? 'text' : 'password';
 }}
 
 function getApiKey() {{
-    return (document.getElementById('inspire-api-key').value || '').trim();
+    return (DOM.inspireApiKey.value || '').trim();
 }}
 
 function pickRandomSymbols(count) {{
-    const pool = inspireEntries.slice();
-    const result = [];
-    for (let i = 0; i < count && pool.length > 0; i++) {{
-        const idx = Math.floor(Math.random() * pool.length);
-        result.push(pool[idx]);
-        pool.splice(idx, 1);
-    }}
-    return result;
+    const n = sampleToFront(inspirePool, count);
+    return inspirePool.slice(0, n);
 }}
 
 function truncateDefinition(text, maxLen) {{
@@ -1359,33 +1745,52 @@ function truncateDefinition(text, maxLen) {{
     return truncated.substring(0, truncated.lastIndexOf(' ')) + '...';
 }}
 
+// Card and prompt excerpts, cut once per entry and reused across re-rolls
+const CARD_EXCERPT = new Array(ENTRY_COUNT);
+const PROMPT_EXCERPT = new Array(ENTRY_COUNT);
+
+function cardExcerpt(id) {{
+    if (CARD_EXCERPT[id] === undefined) {{
+        CARD_EXCERPT[id] = truncateDefinition(DEFS[id], 180);
+    }}
+    return CARD_EXCERPT[id];
+}}
+
+function promptExcerpt(id) {{
+    if (PROMPT_EXCERPT[id] === undefined) {{
+        PROMPT_EXCERPT[id] = truncateDefinition(DEFS[id], 400);
+    }}
+    return PROMPT_EXCERPT[id];
+}}
+
 function displaySymbols(symbols) {{
-    const container = document.getElementById('inspire-symbols');
-    container.innerHTML = symbols.map(s => {{
-        const excerpt = truncateDefinition(s.definition, 180);
-        return '<div class="inspire-symbol-card">' +
-            '<h4>' + escapeHtml(s.term) + '</h4>' +
-            '<p>' + escapeHtml(excerpt) + '</p>' +
-            '</div>';
-    }}).join('');
+    const card = DOM.inspireCardTpl.content.firstElementChild;
+    const frag = document.createDocumentFragment();
+    for (const s of symbols) {{
+        const node = card.cloneNode(true);
+        node.firstElementChild.textContent = TERMS[s];
+        node.lastElementChild.textContent = cardExcerpt(s);
+        frag.appendChild(node);
+    }}
+    DOM.inspireSymbols.replaceChildren(frag);
 }}
 
 function showInspireError(message) {{
-    const el = document.getElementById('inspire-error');
+    const el = DOM.inspireError;
     el.textContent = message;
     el.style.display = 'block';
 }}
 
 function hideInspireError() {{
-    document.getElementById('inspire-error').style.display = 'none';
+    DOM.inspireError.style.display = 'none';
 }}
 
 function inspireReroll() {{
     hideInspireError();
-    const count = parseInt(document.getElementById('inspire-count').value);
+    const count = parseInt(DOM.inspireCount.value);
     inspireSymbols = pickRandomSymbols(count);
     displaySymbols(inspireSymbols);
-    document.getElementById('inspire-narrative').style.display = 'none';
+    DOM.inspireNarrative.style.display = 'none';
 }}
 
 async function inspireGenerate() {{
@@ -1401,46 +1806,54 @@ async function inspireGenerate() {{
         return;
     }}
 
-    const count = parseInt(document.getElementById('inspire-count').value);
+    const count = parseInt(DOM.inspireCount.value);
     inspireSymbols = pickRandomSymbols(count);
     displaySymbols(inspireSymbols);
 
-    document.getElementById('inspire-reroll').style.display = '';
+    DOM.inspireReroll.style.display = '';
 
     await generateNarrative(inspireSymbols);
 }}
 
+// The fixed parts of the Inspire prompt; only the count and symbols vary
+const PROMPT_INTRO = 'You are a visionary creative writer with deep knowledge of symbolism and mythology. Given the following ';
+const PROMPT_SYMBOLS = ' symbols from a Dictionary of Symbols, describe a vivid scene or vision that weaves ALL of these symbols together into one unified narrative.\\n\\nSYMBOLS:\\n';
+const PROMPT_INSTRUCTIONS = '\\n\\nINSTRUCTIONS:\\n- Describe the scene as if it is a living vision or dream — what do you SEE?\\n- STRICTLY FORBIDDEN: Do NOT use any of these words or concepts: painting, mural, tapestry, canvas, oil, brushwork, impasto, gold leaf, mixed-media, composition, rendered, foreground, background, chiaroscuro, gallery, artwork, piece, work, viewer, image, frame, depicted, portrayed, medium, technique, pigment, palette. Do not reference any artistic process, material, or method whatsoever.\\n- Weave ALL the symbols together into one interconnected scene — do not describe them one by one.\\n- Describe colors, light, shadow, atmosphere, mood, and spatial relationships naturally as part of the scene.\\n- Draw on the symbolic meanings to create thematic depth and interconnections.\\n- Give the scene a title.\\n- Keep the description between 200-300 words.\\n- Write in vivid, evocative prose as if narrating a dream or myth.\\n\\nRespond with ONLY the title on the first line (no label, just the title), then a blank line, then the description. No preamble, no meta-commentary.';
+
+// Markdown the model may wrap the title in, and the blank lines between paragraphs
+const MD_HEADING_RE = /^#+\\s*/;
+const MD_STARS_RE = /^\\*+|\\*+$/g;
+const PARAGRAPH_BREAK_RE = /\\n\\n+/;
+
+// Request body around the prompt; only the prompt string needs JSON escaping
+const REQUEST_BODY_HEAD = '{{"model":"claude-haiku-4-5-20251001","max_tokens":1024,"messages":[{{"role":"user","content":';
+const REQUEST_BODY_TAIL = '}}]}}';
+
+const API_HEADERS = {{
+    'Content-Type': 'application/json',
+    'anthropic-version': '2023-06-01',
+    'anthropic-dangerous-direct-browser-access': 'true',
+}};
+
 async function generateNarrative(symbols) {{
-    const loading = document.getElementById('inspire-loading');
-    const narrativeEl = document.getElementById('inspire-narrative');
-    const generateBtn = document.getElementById('inspire-generate');
+    const loading = DOM.inspireLoading;
+    const narrativeEl = DOM.inspireNarrative;
+    const generateBtn = DOM.inspireGenerate;
 
     loading.style.display = 'block';
     narrativeEl.style.display = 'none';
     generateBtn.disabled = true;
 
-    const symbolDescriptions = symbols.map(s => {{
-        const excerpt = truncateDefinition(s.definition, 400);
-        return s.term + ': ' + excerpt;
-    }}).join('\\n\\n');
+    const symbolDescriptions = symbols.map(s => TERMS[s] + ': ' + promptExcerpt(s)).join('\\n\\n');
 
-    const prompt = 'You are a visionary creative writer with deep knowledge of symbolism and mythology. Given the following ' + symbols.length + ' symbols from a Dictionary of Symbols, describe a vivid scene or vision that weaves ALL of these symbols together into one unified narrative.\\n\\nSYMBOLS:\\n' + symbolDescriptions + '\\n\\nINSTRUCTIONS:\\n- Describe the scene as if it is a living vision or dream — what do you SEE?\\n- STRICTLY FORBIDDEN: Do NOT use any of these words or concepts: painting, mural, tapestry, canvas, oil, brushwork, impasto, gold leaf, mixed-media, composition, rendered, foreground, background, chiaroscuro, gallery, artwork, piece, work, viewer, image, frame, depicted, portrayed, medium, technique, pigment, palette. Do not reference any artistic process, material, or method whatsoever.\\n- Weave ALL the symbols together into one interconnected scene — do not describe them one by one.\\n- Describe colors, light, shadow, atmosphere, mood, and spatial relationships naturally as part of the scene.\\n- Draw on the symbolic meanings to create thematic depth and interconnections.\\n- Give the scene a title.\\n- Keep the description between 200-300 words.\\n- Write in vivid, evocative prose as if narrating a dream or myth.\\n\\nRespond with ONLY the title on the first line (no label, just the title), then a blank line, then the description. No preamble, no meta-commentary.';
+    const prompt = PROMPT_INTRO + symbols.length + PROMPT_SYMBOLS + symbolDescriptions + PROMPT_INSTRUCTIONS;
 
-    const body = JSON.stringify({{
-        model: 'claude-haiku-4-5-20251001',
-        max_tokens: 1024,
-        messages: [{{ role: 'user', content: prompt }}],
-    }});
+    const body = REQUEST_BODY_HEAD + JSON.stringify(prompt) + REQUEST_BODY_TAIL;
 
     try {{
         const response = await fetch('https://api.anthropic.com/v1/messages', {{
             method: 'POST',
-            headers: {{
-                'Content-Type': 'application/json',
-                'x-api-key': getApiKey(),
-                'anthropic-version': '2023-06-01',
-                'anthropic-dangerous-direct-browser-access': 'true',
-            }},
+            headers: {{ ...API_HEADERS, 'x-api-key': getApiKey() }},
             body: body,
         }});
 
@@ -1461,15 +1874,23 @@ async function generateNarrative(symbols) {{
         const text = data.content[0].text.trim();
 
         const lines = text.split('\\n');
-        const title = lines[0].replace(/^#+\\s*/, '').replace(/^\\*+|\\*+$/g, '').trim();
+        const title = lines[0].replace(MD_HEADING_RE, '').replace(MD_STARS_RE, '').trim();
         const bodyText = lines.slice(1).join('\\n').trim();
 
-        const paragraphs = bodyText.split(/\\n\\n+/).filter(p => p.trim());
-        const bodyHtml = paragraphs.map(p => '<p>' + escapeHtml(p.trim()) + '</p>').join('');
+        const heading = document.createElement('h3');
+        heading.textContent = title;
+        const bodyDiv = document.createElement('div');
+        bodyDiv.className = 'narrative-body';
+        for (const p of bodyText.split(PARAGRAPH_BREAK_RE)) {{
+            const para = p.trim();
+            if (!para) continue;
+            const pe = document.createElement('p');
+            pe.textContent = para;
+            bodyDiv.appendChild(pe);
+        }}
+        const copyRow = DOM.inspireCopyTpl.content.firstElementChild.cloneNode(true);
 
-        narrativeEl.innerHTML = '<h3>' + escapeHtml(title) + '</h3>' +
-            '<div class="narrative-body">' + bodyHtml + '</div>' +
-            '<div class="narrative-copy-row"><button class="copy-btn" onclick="copyNarrative(event)">&#x2398; Copy</button></div>';
+        narrativeEl.replaceChildren(heading, bodyDiv, copyRow);
         narrativeEl.style.display = 'block';
 
     }} catch (err) {{
@@ -1484,30 +1905,119 @@ async function generateNarrative(symbols) {{
 // INIT
 // ============================================================
 buildDictionary();
+renderForHash(location.hash);
+
+// One delegated listener each for cards, the alpha nav and the mode toggle
+DOM.dictContainer.addEventListener('click', ev => {{
+    const card = ev.target.closest('.card');
+    if (card) openModal(+card.dataset.id);
+}});
+
+DOM.alphaNav.addEventListener('click', ev => {{
+    const btn = ev.target.closest('.alpha-btn');
+    if (!btn || btn.classList.contains('disabled')) return;
+    filterByLetter(btn.textContent === 'ALL' ? null : btn.textContent);
+}});
+
+DOM.quizOptions.addEventListener('click', ev => {{
+    const btn = ev.target.closest('.quiz-option');
+    if (!btn || btn.classList.contains('disabled')) return;
+    checkAnswer(btn, TERMS[+btn.dataset.id], TERMS[currentQuizId]);
+}});
+
+DOM.modeToggle.addEventListener('click', ev => {{
+    const btn = ev.target.closest('.mode-btn');
+    if (btn) switchMode(btn.dataset.mode);
+}});
+
+window.addEventListener('pagehide', flushApiKey);
+document.addEventListener('visibilitychange', () => {{
+    if (document.visibilityState === 'hidden') flushApiKey();
+}});
+
+// Sections the observer hasn't reached are empty placeholders; fill them all before printing
+window.addEventListener('beforeprint', () => Object.keys(ENTRIES_BY_LETTER).forEach(renderLetter));
+
+// Lowercase the search strings while idle so the first keystroke doesn't pay for it
+(window.requestIdleCallback || (cb => setTimeout(cb, 1)))(() => {{
+    if (!searchHay) searchHay = buildSearchHay();
+}});
 </script>
 </body>
 </html>"""
 
-    return html_content
-
-
-def main():
-    # Load dictionary data
-    print(f"Loading dictionary: {DICT_PATH}")
-    with open(DICT_PATH, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    return page_head, page_tail
+
+
+def write_html(f, entries):
+    """
+    Write the complete HTML page (no images) to text file f. Entries are
+    laid out as parallel arrays indexed by entry id; definitions are
+    serialised one at a time and only the short per-entry columns are
+    held in memory. Returns (definitions, cross_references).
+    """
+    page_head, page_tail = _page_parts()
+    f.write(page_head)
+    terms = []
+    xref_flags = []
+    pages = []
+    f.write('{"defs":')
+    separator = "["
+    for entry in entries:
+        f.write(separator)
+        f.write(_script_json(entry["definition"]))
+        separator = ","
+        terms.append(entry["term"])
+        xref_flags.append(entry["is_cross_ref"])
+        pages.append(entry.get("page", 0))
+    # An empty list is dumped as "[]"
+    f.write("[]" if separator == "[" else "]")
+
+    by_letter = {}
+    for entry_id, term in enumerate(terms):
+        by_letter.setdefault(_letter(term), []).append(entry_id)
+
+    f.write(',"terms":')
+    f.write(_script_json(terms))
+    f.write(',"terms_html":')
+    f.write(_script_json([html_module.escape(term) for term in terms]))
+    f.write(',"slugs":')
+    f.write(_script_json([slugify(term) for term in terms]))
+    f.write(f',"xref_bits":"{_pack_bits(xref_flags)}"')
+    f.write(',"pages":')
+    f.write(_dumps(pages))
+    f.write(',"by_letter":')
+    f.write(_dumps(dict(sorted(by_letter.items()))))
+    f.write("}")
+    f.write(page_tail)
+
+    xrefs = sum(xref_flags)
+    return len(xref_flags) - xrefs, xrefs
 
-    entries = data["entries"]
-    defs = sum(1 for e in entries if not e["is_cross_ref"])
-    xrefs = sum(1 for e in entries if e["is_cross_ref"])
-    print(f"  Entries: {len(entries)} ({defs} definitions, {xrefs} cross-references)")
 
-    # Generate HTML
-    html = generate_html(entries)
+def generate_html(entries):
+    """Generate the complete HTML page (no images)."""
+    buf = io.StringIO()
+    write_html(buf, entries)
+    return buf.getvalue()
 
-    with open(OUTPUT_PATH, "w", encoding="utf-8") as f:
-        f.write(html)
 
+def main():
+    # Stream dictionary entries straight into the generated page
+    print(f"Loading dictionary: {DICT_PATH}")
+    # Write next to the output and swap it in only once the page is
+    # complete, so a missing or bad input leaves the last good page alone
+    tmp_path = OUTPUT_PATH + ".tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            defs, xrefs = write_html(f, stream_entries(DICT_PATH))
+        os.replace(tmp_path, OUTPUT_PATH)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    print(f"  Entries: {defs + xrefs} ({defs} definitions, {xrefs} cross-references)")
     print(f"\nHTML written to: {OUTPUT_PATH}")
     print(f"  File size: {os.path.getsize(OUTPUT_PATH) / 1024:.0f} KB")
 
@@ -0,0 +1,73 @@
+"""
+Tests for stitching per-page-range scan results back into entries.
+
+_assemble_entries() works on the (leading_lines, segments) pairs that
+_scan_pages() returns, so these run without the PDF.
+
+Run with: python -m unittest test_extract_symbols
+"""
+
+import unittest
+
+from extract_symbols import _assemble_entries
+
+
+def _summary(entries):
+    return [(e["term"], e["definition"], e["page"]) for e in entries]
+
+
+class AssembleEntriesTest(unittest.TestCase):
+
+    def test_leading_lines_continue_previous_entry(self):
+        chunks = [
+            ([], [["alpha", 0, ["Alpha begins on one page"]]]),
+            (["and ends on the next."], [["beta", 5, ["Beta stands alone."]]]),
+        ]
+        self.assertEqual(_summary(_assemble_entries(chunks)), [
+            ("alpha", "Alpha begins on one page and ends on the next.", 1),
+            ("beta", "Beta stands alone.", 6),
+        ])
+
+    def test_range_without_heading(self):
+        chunks = [
+            ([], [["alpha", 0, ["Alpha runs"]]]),
+            (["through a whole range"], []),
+            (["into a third."], [["beta", 9, ["Beta stands alone."]]]),
+        ]
+        self.assertEqual(_summary(_assemble_entries(chunks)), [
+            ("alpha", "Alpha runs through a whole range into a third.", 1),
+            ("beta", "Beta stands alone.", 10),
+        ])
+
+    def test_lines_before_first_heading_are_dropped(self):
+        chunks = [
+            (["Front matter with no entry."], []),
+            (["More front matter."], [["alpha", 3, ["Alpha stands alone."]]]),
+        ]
+        self.assertEqual(_summary(_assemble_entries(chunks)), [
+            ("alpha", "Alpha stands alone.", 4),
+        ])
+
+    def test_split_ranges_match_single_range(self):
+        def single():
+            return [(
+                ["Orphan line."],
+                [
+                    ["alpha", 0, ["Alpha one", "alpha two", "alpha three."]],
+                    ["beta", 2, ["Beta one", "beta two."]],
+                ],
+            )]
+
+        def split():
+            return [
+                (["Orphan line."], [["alpha", 0, ["Alpha one"]]]),
+                (["alpha two"], []),
+                (["alpha three."], [["beta", 2, ["Beta one"]]]),
+                (["beta two."], []),
+            ]
+
+        self.assertEqual(_assemble_entries(split()), _assemble_entries(single()))
+
+
+if __name__ == "__main__":
+    unittest.main()